@@ -4,6 +4,7 @@ errors used in ``ramp-database``.
 """
 
 __all__ = [
+    'RampDatabaseError',
     'DuplicateSubmissionError',
     'MergeTeamError',
     'MissingExtensionError',
@@ -14,37 +15,42 @@ __all__ = [
     ]
 
 
-class DuplicateSubmissionError(Exception):
+class RampDatabaseError(Exception):
+    """Base class for all the errors raised by ``ramp-database``."""
+    pass
+
+
+class DuplicateSubmissionError(RampDatabaseError):
     """Error to raise when a submission is already present in the database."""
     pass
 
 
-class MergeTeamError(Exception):
+class MergeTeamError(RampDatabaseError):
     """Error to raise when the merging of teams is failing."""
     pass
 
 
-class MissingSubmissionFileError(Exception):
+class MissingSubmissionFileError(RampDatabaseError):
     """Error to raise when the file submitted is not present in the supposed
     location."""
     pass
 
 
-class MissingExtensionError(Exception):
+class MissingExtensionError(RampDatabaseError):
     """Error to raise when the extension is not registered in the database."""
     pass
 
 
-class NameClashError(Exception):
+class NameClashError(RampDatabaseError):
     """Error to raise when there is a duplicate in submission name."""
     pass
 
 
-class TooEarlySubmissionError(Exception):
+class TooEarlySubmissionError(RampDatabaseError):
     """Error to raise when a submission was submitted to early."""
     pass
 
 
-class UnknownStateError(Exception):
+class UnknownStateError(RampDatabaseError):
     """Error to raise when the state of the submission is unknown."""
     pass
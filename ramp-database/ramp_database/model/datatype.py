@@ -1,3 +1,4 @@
+import io
 import pickle
 import zlib
 
@@ -8,35 +9,56 @@ from sqlalchemy import TypeDecorator
 
 __all__ = ['NumpyType']
 
+# magic string opening every buffer written by np.lib.format.write_array
+_NPY_MAGIC = b'\x93NUMPY'
+
 
 class NumpyType(TypeDecorator):
     """Storing zipped numpy arrays."""
     impl = LargeBinary
 
     def process_bind_param(self, value, dialect):
-        """Compress and pickle NumPy arrays on disk.
+        """Serialize and compress NumPy arrays on disk.
 
         Parameters
         ----------
         value : ndarray
-            The array to pickle.
+            The array to serialize.
         dialect : Dialect
             Dialect in use.
         Returns
         -------
-        pickle : pickle
-            The compress pickle.
+        blob : bytes
+            The compressed array buffer.
         """
-        # we convert the initial value into np.array to handle None and lists
-        return zlib.compress(np.array(value).dumps())
+        # map None to NULL directly instead of serializing a 0-d object
+        # array; the score bags are reset to None before training and paying
+        # the buffer and compression setup for them is wasted work
+        if value is None:
+            return None
+        # we convert the initial value into np.array to handle lists
+        arr = np.asarray(value)
+        if arr.dtype.hasobject:
+            # object payloads cannot take the raw buffer path; pickle them
+            # directly with the highest protocol (write_array pins an older
+            # one) -- the reader falls back to pickle.loads for these blobs
+            return zlib.compress(
+                pickle.dumps(arr, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        # writing the raw npy buffer avoids the pickle machinery for the
+        # numeric arrays stored here
+        buff = io.BytesIO()
+        np.lib.format.write_array(buff, arr, allow_pickle=False)
+        # level 1 compresses numeric arrays nearly as well as the default
+        # level 6 while being several times faster on these hot reads/writes
+        return zlib.compress(buff.getbuffer(), 1)
 
     def process_result_value(self, value, dialect):
-        """Load pickle into NumPy array.
+        """Load a compressed buffer into a NumPy array.
 
         Parameters
         ----------
-        value : pickle
-            The NumPy array which was dumped into a pickle.
+        value : bytes
+            The compressed buffer of the NumPy array which was stored.
         dialect : Dialect
             Dialect in use.
         Returns
@@ -44,4 +66,11 @@ class NumpyType(TypeDecorator):
         array : ndarray
             The NumPy array which has been loaded.
         """
-        return pickle.loads(zlib.decompress(value))
+        if value is None:
+            return None
+        buff = zlib.decompress(value)
+        if buff.startswith(_NPY_MAGIC):
+            return np.lib.format.read_array(io.BytesIO(buff),
+                                            allow_pickle=True)
+        # rows written before the switch to the npy format were pickled
+        return pickle.loads(buff)
@@ -2,6 +2,8 @@ import os
 import hashlib
 import datetime
 
+import numpy as np
+
 from sqlalchemy import Enum
 from sqlalchemy import Float
 from sqlalchemy import Column
@@ -13,6 +15,7 @@ from sqlalchemy import ForeignKey
 from sqlalchemy import UniqueConstraint
 from sqlalchemy import inspect
 from sqlalchemy.orm import backref
+from sqlalchemy.orm import deferred
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.hybrid import hybrid_property
 
@@ -56,6 +59,15 @@ def _encode_string(text):
     return bytes(text, 'utf-8') if isinstance(text, str) else text
 
 
+def _take_fold(y_pred, indices):
+    # fancy indexing always copies; when the fold indices are contiguous
+    # (e.g. k-fold on unshuffled data) an equivalent slice returns a view
+    if len(indices) and indices[-1] - indices[0] == len(indices) - 1 and \
+            np.all(np.diff(indices) == 1):
+        return y_pred[indices[0]:indices[-1] + 1]
+    return y_pred[indices]
+
+
 class Submission(Model):
     """Submission table.
 
@@ -154,11 +166,11 @@ class Submission(Model):
     historical_contributivity = Column(Float, default=0.0)
 
     type = Column(submission_types, default='live')
-    state = Column(String, default='new')
+    state = Column(String, default='new', index=True)
     # TODO: hide absolute path in error
     error_msg = Column(String, default='')
     # user can delete but we keep
-    is_valid = Column(Boolean, default=True)
+    is_valid = Column(Boolean, default=True, index=True)
     # We can forget bad models.
     # If false, don't combine and set contributivity to zero
     is_to_ensemble = Column(Boolean, default=True)
@@ -183,13 +195,12 @@ class Submission(Model):
         self.name = name
         self.event_team = event_team
         self.session = inspect(event_team).session
-        sha_hasher = hashlib.sha1()
-        sha_hasher.update(_encode_string(self.event.name))
-        sha_hasher.update(_encode_string(self.team.name))
-        sha_hasher.update(_encode_string(self.name))
+        sha_hasher = hashlib.sha1(b''.join(
+            _encode_string(text)
+            for text in (self.event.name, self.team.name, self.name)))
         # We considered using the id, but then it will be given away in the
         # url which is maybe not a good idea.
-        self.hash_ = '{}'.format(sha_hasher.hexdigest())
+        self.hash_ = sha_hasher.hexdigest()
         self.submission_timestamp = datetime.datetime.utcnow()
         if session is None:
             event_score_types = \
@@ -291,7 +302,7 @@ class Submission(Model):
     @property
     def basename(self):
         """str: The base name of the submission."""
-        return 'submission_' + '{:09d}'.format(self.id)
+        return f'submission_{self.id:09d}'
 
     @property
     def module(self):
@@ -316,8 +327,8 @@ class Submission(Model):
         The hyperlink forward to the first submission file while the text
         corresponds to the event, team, and submission name.
         """
-        return '<a href={}>{}/{}/{}</a>'.format(
-            self.link, self.event.name, self.team.name, self.name[:20])
+        return (f'<a href={self.link}>{self.event.name}/{self.team.name}'
+                f'/{self.name[:20]}</a>')
 
     @property
     def name_with_link(self):
@@ -327,13 +338,12 @@ class Submission(Model):
         The hyperlink forward to the first submission file while the text
         corresponds to submission name.
         """
-        return '<a href={}>{}</a>'.format(self.link, self.name[:20])
+        return f'<a href={self.link}>{self.name[:20]}</a>'
 
     @property
     def state_with_link(self):
         """str: HTML hyperlink to the state file to report error."""
-        return '<a href=/{}>{}</a>'.format(
-            os.path.join(self.hash_, 'error.txt'), self.state)
+        return f'<a href=/{self.hash_}/error.txt>{self.state}</a>'
 
     def ordered_scores(self, score_names):
         """Generator yielding :class:`ramp_database.model.SubmissionScore`.
@@ -650,7 +660,7 @@ class SubmissionFile(Model):
     @property
     def f_name(self):
         """str: The corresponding file name."""
-        return self.type + '.' + self.extension
+        return f'{self.type}.{self.extension}'
 
     @property
     def link(self):
@@ -666,7 +676,7 @@ class SubmissionFile(Model):
     @property
     def name_with_link(self):
         """str: The HTML hyperlink of the name of the submission file."""
-        return '<a href="' + self.link + '">' + self.name + '</a>'
+        return f'<a href="{self.link}">{self.name}</a>'
 
     def get_code(self):
         """str: Get the content of the file."""
@@ -909,7 +919,9 @@ class SubmissionOnCVFold(Model):
                                               cascade="all, delete-orphan"))
 
     cv_fold_id = Column(Integer, ForeignKey('cv_folds.id'), nullable=False)
-    cv_fold = relationship('CVFold',
+    # eager many-to-one load: scoring and the prediction properties always
+    # need the fold indices, and a lazy load would emit one query per fold
+    cv_fold = relationship('CVFold', lazy='joined',
                            backref=backref('submissions',
                                            cascade="all, delete-orphan"))
 
@@ -918,13 +930,15 @@ class SubmissionOnCVFold(Model):
     best = Column(Boolean, default=False)
 
     # prediction on the full training set, including train and valid points
-    # properties train_predictions and valid_predictions will make the slicing
-    full_train_y_pred = Column(NumpyType, default=None)
-    test_y_pred = Column(NumpyType, default=None)
+    # properties train_predictions and valid_predictions will make the
+    # slicing; deferred so that queries which only look at states and scores
+    # (e.g. the leaderboards) do not fetch and unpickle the large blobs
+    full_train_y_pred = deferred(Column(NumpyType, default=None))
+    test_y_pred = deferred(Column(NumpyType, default=None))
     train_time = Column(Float, default=0.0)
     valid_time = Column(Float, default=0.0)
     test_time = Column(Float, default=0.0)
-    state = Column(submission_states, default='new')
+    state = Column(submission_states, default='new', index=True)
     error_msg = Column(String, default='')
 
     UniqueConstraint(submission_id, cv_fold_id, name='sc_constraint')
@@ -983,14 +997,14 @@ class SubmissionOnCVFold(Model):
         """:class:`rampwf.prediction_types.Predictions`: Training
         predictions."""
         return self.submission.Predictions(
-            y_pred=self.full_train_y_pred[self.cv_fold.train_is])
+            y_pred=_take_fold(self.full_train_y_pred, self.cv_fold.train_is))
 
     @property
     def valid_predictions(self):
         """:class:`rampwf.prediction_types.Predictions`: Validation
         predictions."""
         return self.submission.Predictions(
-            y_pred=self.full_train_y_pred[self.cv_fold.test_is])
+            y_pred=_take_fold(self.full_train_y_pred, self.cv_fold.test_is))
 
     @property
     def test_predictions(self):
@@ -1044,11 +1058,21 @@ class SubmissionOnCVFold(Model):
         self.state = error
         self.error_msg = error_msg
 
-    def compute_train_scores(self):
-        """Compute all training scores."""
+    def compute_train_scores(self, true_full_train_predictions=None):
+        """Compute all training scores.
+
+        Parameters
+        ----------
+        true_full_train_predictions : \
+None or :class:`rampwf.prediction_types.Predictions`, default is None
+            The ground truths on the full training set. Pass them in when
+            scoring several folds of the same event to avoid reloading the
+            training data for each fold.
+        """
         if self.is_trained:
-            true_full_train_predictions = \
-                self.submission.event.problem.ground_truths_train()
+            if true_full_train_predictions is None:
+                true_full_train_predictions = \
+                    self.submission.event.problem.ground_truths_train()
             for score in self.scores:
                 score.train_score = float(score.score_function(
                     true_full_train_predictions,
@@ -1058,11 +1082,21 @@ class SubmissionOnCVFold(Model):
             for score in self.scores:
                 score.train_score = score.event_score_type.worst
 
-    def compute_valid_scores(self):
-        """Compute all validating scores."""
+    def compute_valid_scores(self, true_full_train_predictions=None):
+        """Compute all validating scores.
+
+        Parameters
+        ----------
+        true_full_train_predictions : \
+None or :class:`rampwf.prediction_types.Predictions`, default is None
+            The ground truths on the full training set. Pass them in when
+            scoring several folds of the same event to avoid reloading the
+            training data for each fold.
+        """
         if self.is_validated:
-            true_full_train_predictions = \
-                self.submission.event.problem.ground_truths_train()
+            if true_full_train_predictions is None:
+                true_full_train_predictions = \
+                    self.submission.event.problem.ground_truths_train()
             for score in self.scores:
                 score.valid_score = float(score.score_function(
                     true_full_train_predictions,
@@ -1072,11 +1106,21 @@ class SubmissionOnCVFold(Model):
             for score in self.scores:
                 score.valid_score = score.event_score_type.worst
 
-    def compute_test_scores(self):
-        """Compute all testing scores."""
+    def compute_test_scores(self, true_test_predictions=None):
+        """Compute all testing scores.
+
+        Parameters
+        ----------
+        true_test_predictions : \
+None or :class:`rampwf.prediction_types.Predictions`, default is None
+            The ground truths on the testing set. Pass them in when scoring
+            several folds of the same event to avoid reloading the testing
+            data for each fold.
+        """
         if self.is_tested:
-            true_test_predictions = \
-                self.submission.event.problem.ground_truths_test()
+            if true_test_predictions is None:
+                true_test_predictions = \
+                    self.submission.event.problem.ground_truths_test()
             for score in self.scores:
                 score.test_score = float(score.score_function(
                     true_test_predictions,
@@ -1098,16 +1142,18 @@ class SubmissionOnCVFold(Model):
         self.state = detached_submission_on_cv_fold.state
         if self.is_error:
             self.error_msg = detached_submission_on_cv_fold.error_msg
-        else:
-            if self.is_trained:
-                self.train_time = detached_submission_on_cv_fold.train_time
-            if self.is_validated:
-                self.valid_time = detached_submission_on_cv_fold.valid_time
-                self.full_train_y_pred = \
-                    detached_submission_on_cv_fold.full_train_y_pred
-            if self.is_tested:
-                self.test_time = detached_submission_on_cv_fold.test_time
-                self.test_y_pred = detached_submission_on_cv_fold.test_y_pred
+            return
+        # the states form a lattice: copy the fields owned by each stage
+        # the submission reached
+        for stage_reached, attributes in (
+                ('is_trained', ('train_time',)),
+                ('is_validated', ('valid_time', 'full_train_y_pred')),
+                ('is_tested', ('test_time', 'test_y_pred'))):
+            if getattr(self, stage_reached):
+                for attribute in attributes:
+                    setattr(self, attribute,
+                            getattr(detached_submission_on_cv_fold,
+                                    attribute))
 
 
 class DetachedSubmissionOnCVFold:
@@ -1182,7 +1228,9 @@ class SubmissionSimilarity(Model):
     id = Column(Integer, primary_key=True)
     type = Column(submission_similarity_type, nullable=False)
     note = Column(String, default=None)
-    timestamp = Column(DateTime, default=datetime.datetime.utcnow())
+    # pass the callable: calling utcnow() here would freeze the default to
+    # the import time of this module
+    timestamp = Column(DateTime, default=datetime.datetime.utcnow)
     similarity = Column(Float, default=0.0)
 
     user_id = Column(Integer, ForeignKey('users.id'))
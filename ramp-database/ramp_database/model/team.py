@@ -80,6 +80,9 @@ class Team(Model):
         return 'Team({})'.format(self.name)
 
     def __repr__(self):
-        return ('Team(name={}, admin_name={}, initiator={}, acceptor={})'
+        # print the initiator/acceptor ids: going through the relationships
+        # would lazy-load and recursively repr the related teams
+        return ('Team(name={}, admin_name={}, initiator_id={}, '
+                'acceptor_id={})'
                 .format(self.name, self.admin.name,
-                        self.initiator, self.acceptor))
+                        self.initiator_id, self.acceptor_id))
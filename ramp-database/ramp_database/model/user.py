@@ -175,10 +175,10 @@ class User(Model):
         return 'User({})'.format(self.name)
 
     def __repr__(self):
-        return ("User(name={}, lastname={}, firstname={}, email={}, "
-                "admined_teams={})"
-                .format(self.name, self.lastname, self.firstname,
-                        self.email, self.admined_teams))
+        # do not include admined_teams: repr is called by loggers and
+        # debuggers and the back-reference would trigger a lazy SQL load
+        return ("User(name={}, lastname={}, firstname={}, email={})"
+                .format(self.name, self.lastname, self.firstname, self.email))
 
 
 user_interaction_type = Enum(
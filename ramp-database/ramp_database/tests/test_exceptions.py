@@ -1,5 +1,6 @@
 import pytest
 
+from ramp_database.exceptions import RampDatabaseError
 from ramp_database.exceptions import DuplicateSubmissionError
 from ramp_database.exceptions import MergeTeamError
 from ramp_database.exceptions import MissingExtensionError
@@ -55,3 +56,18 @@ def test_exceptions_obj(ExceptionClass):
 
     with pytest.raises(ExceptionClass):
         raise ExceptionClass(DummyObject())
+
+
+@pytest.mark.parametrize(
+    "ExceptionClass",
+    [DuplicateSubmissionError,
+     MergeTeamError,
+     MissingExtensionError,
+     MissingSubmissionFileError,
+     NameClashError,
+     TooEarlySubmissionError,
+     UnknownStateError]
+)
+def test_exceptions_base_class(ExceptionClass):
+    with pytest.raises(RampDatabaseError):
+        raise ExceptionClass('Some error message')
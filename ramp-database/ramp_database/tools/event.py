@@ -1,6 +1,8 @@
 import logging
 import os
 
+import numpy as np
+
 from sqlalchemy.orm.exc import NoResultFound
 
 from ramp_utils.utils import import_module_from_source
@@ -263,9 +265,11 @@ def add_event(session, problem_name, event_name, event_title,
     X_train, y_train = event.problem.get_train_data()
     cv = event.problem.module.get_cv(X_train, y_train)
     for train_indices, test_indices in cv:
+        # store the indices as int32: the splitters return int64 positions
+        # and halving the payload speeds up every (de)compression of the fold
         cv_fold = CVFold(event=event,
-                         train_is=train_indices,
-                         test_is=test_indices)
+                         train_is=np.asarray(train_indices, dtype=np.int32),
+                         test_is=np.asarray(test_indices, dtype=np.int32))
         session.add(cv_fold)
 
     score_types = event.problem.module.score_types
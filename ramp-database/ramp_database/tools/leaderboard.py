@@ -3,6 +3,8 @@ from itertools import product
 import numpy as np
 import pandas as pd
 
+from sqlalchemy.orm import selectinload
+
 from ..model.event import Event
 from ..model.event import EventTeam
 from ..model.submission import Submission
@@ -265,6 +267,8 @@ def get_leaderboard(session, leaderboard_type, event_name, user_name=None,
         The leaderboard in HTML format.
     """
     q = (session.query(Submission)
+                .options(selectinload(Submission.scores),
+                         selectinload(Submission.files))
                 .filter(Event.id == EventTeam.event_id)
                 .filter(Team.id == EventTeam.team_id)
                 .filter(EventTeam.id == Submission.event_team_id)
@@ -116,8 +116,9 @@ def add_submission(session, event_name, team_name, submission_name,
                          .format(submission_name, team_name, event_name))
             raise DuplicateSubmissionError(error_msg)
 
-    files_type_extension = [os.path.splitext(filename)
-                            for filename in os.listdir(submission_path)]
+    with os.scandir(submission_path) as entries:
+        files_type_extension = [os.path.splitext(entry.name)
+                                for entry in entries]
     # filter the files which contain an extension
     # remove the dot of the extension.
     files_type_extension = [(filename, extension[1:])
@@ -657,13 +658,9 @@ def set_time(session, submission_id, path_predictions):
     for fold_id, cv_fold in enumerate(all_cv_folds):
         path_results = os.path.join(path_predictions,
                                     'fold_{}'.format(fold_id))
-        results = {}
         for step in ('train', 'valid', 'test'):
-            results[step + '_time'] = np.loadtxt(
-                os.path.join(path_results, step + '_time')
-            ).item()
-        for key, value in results.items():
-            setattr(cv_fold, key, value)
+            with open(os.path.join(path_results, step + '_time')) as f:
+                setattr(cv_fold, step + '_time', float(f.read()))
     session.commit()
 
 
@@ -792,13 +789,19 @@ def score_submission(session, submission_id):
     all_cv_folds = (session.query(SubmissionOnCVFold)
                            .filter_by(submission_id=submission_id)
                            .all())
+    # load the ground truths once: they are identical for all folds and
+    # each ground_truths_* call reads the data back from disk
+    problem = submission.event.problem
+    true_full_train_predictions = problem.ground_truths_train()
+    true_test_predictions = problem.ground_truths_test()
     for submission_on_cv_fold in all_cv_folds:
         submission_on_cv_fold.session = session
-        submission_on_cv_fold.compute_train_scores()
-        submission_on_cv_fold.compute_valid_scores()
-        submission_on_cv_fold.compute_test_scores()
+        submission_on_cv_fold.compute_train_scores(
+            true_full_train_predictions)
+        submission_on_cv_fold.compute_valid_scores(
+            true_full_train_predictions)
+        submission_on_cv_fold.compute_test_scores(true_test_predictions)
         submission_on_cv_fold.state = 'scored'
-    session.commit()
     # TODO: We are not managing the bagged score.
     # submission.compute_test_score_cv_bag(session)
     # submission.compute_valid_score_cv_bag(session)
@@ -808,18 +811,12 @@ def score_submission(session, submission_id):
     # the mean and std scores on the private leaderbord), the
     # corresponding columns (which are now redundant) can be deleted in
     # Submission and this computation can also be deleted.
-    submission.train_time_cv_mean = np.mean(
-        [ts.train_time for ts in all_cv_folds])
-    submission.valid_time_cv_mean = np.mean(
-        [ts.valid_time for ts in all_cv_folds])
-    submission.test_time_cv_mean = np.mean(
-        [ts.test_time for ts in all_cv_folds])
-    submission.train_time_cv_std = np.std(
-        [ts.train_time for ts in all_cv_folds])
-    submission.valid_time_cv_std = np.std(
-        [ts.valid_time for ts in all_cv_folds])
-    submission.test_time_cv_std = np.std(
-        [ts.test_time for ts in all_cv_folds])
+    fold_times = np.array([[ts.train_time, ts.valid_time, ts.test_time]
+                           for ts in all_cv_folds])
+    (submission.train_time_cv_mean, submission.valid_time_cv_mean,
+     submission.test_time_cv_mean) = fold_times.mean(axis=0)
+    (submission.train_time_cv_std, submission.valid_time_cv_std,
+     submission.test_time_cv_std) = fold_times.std(axis=0)
     submission.state = 'scored'
     session.commit()
 
@@ -308,10 +308,7 @@ def download_log(config, instance_id, submission_name, folder=None):
             config[LOCAL_LOG_FOLDER_FIELD], submission_name, 'log')
     else:
         dest_path = folder
-    try:
-        os.makedirs(os.path.dirname(dest_path))
-    except OSError:
-        pass
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
     return _download(config, instance_id, source_path, dest_path)
 
 
@@ -430,10 +427,7 @@ def download_predictions(config, instance_id, submission_name, folder=None):
             config[LOCAL_PREDICTIONS_FOLDER_FIELD], submission_name)
     else:
         dest_path = folder
-    try:
-        os.makedirs(os.path.dirname(dest_path))
-    except OSError:
-        pass
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
     _download(config, instance_id, source_path, dest_path)
     return dest_path
 
@@ -148,8 +148,7 @@ class CondaEnvWorker(BaseWorker):
             # write the log into the disk
             log_dir = os.path.join(self.config['logs_dir'],
                                    self.submission)
-            if not os.path.exists(log_dir):
-                os.makedirs(log_dir)
+            os.makedirs(log_dir, exist_ok=True)
             with open(os.path.join(log_dir, 'log'), 'wb+') as f:
                 f.write(log_output)
             # copy the predictions into the disk
@@ -66,21 +66,15 @@ def add_pareto(df, col, worst, is_lower_the_better):
         The dataframe amended with the new column col + ' pareto'
     """
     df_ = df.copy()
-    df_.loc[:, col + ' pareto'] = pd.Series(np.zeros(df.shape[0]),
-                                            index=df_.index)
-    best_score = worst
+    scores = df[col].values
+    # the score of a submission is on the Pareto front if it strictly
+    # improves on the running best of all previous submissions
+    previous_best = np.concatenate([[worst], scores[:-1]])
     if is_lower_the_better:
-        for i, row in df.iterrows():
-            score = row[col]
-            if score < best_score:
-                best_score = score
-                df_.loc[i, col + ' pareto'] = 1
+        is_pareto = scores < np.minimum.accumulate(previous_best)
     else:
-        for i, row in df.iterrows():
-            score = row[col]
-            if score > best_score:
-                best_score = score
-                df_.loc[i, col + ' pareto'] = 1
+        is_pareto = scores > np.maximum.accumulate(previous_best)
+    df_.loc[:, col + ' pareto'] = is_pareto.astype(np.float64)
     return df_
 
 
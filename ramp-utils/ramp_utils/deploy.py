@@ -81,8 +81,7 @@ def deploy_ramp_event(config, event_config, setup_ramp_repo=True, force=False):
                             ramp_config['ramp_data_dir'],
                             force)
 
-        if not os.path.exists(ramp_config['ramp_submissions_dir']):
-            os.makedirs(ramp_config['ramp_submissions_dir'])
+        os.makedirs(ramp_config['ramp_submissions_dir'], exist_ok=True)
         add_event(session, ramp_config['problem_name'],
                   ramp_config['event_name'],
                   ramp_config['event_title'],